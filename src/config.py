@@ -5,8 +5,10 @@ Handles loading and validation of all YAML configuration files.
 Uses Pydantic models for type safety and validation.
 """
 
+import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -14,6 +16,9 @@ from typing import Any, Callable, Dict, List, Optional
 import yaml
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 ## Configuration Models ##
 
@@ -294,6 +299,7 @@ class _ConfigSpec:
     has_template: bool = False
     transform: Optional[Callable] = None       # raw_dict -> dict passed to model(**...)
     default_factory: Optional[Callable] = None  # () -> model instance when file is missing
+    lazy: bool = False                          # load on first get() instead of in load_all() (optional specs only)
 
 
 class ConfigLoader:
@@ -329,6 +335,7 @@ class ConfigLoader:
             required=False,
             has_template=True,
             default_factory=lambda: ConfigDevOpsTags(),
+            lazy=True,
         ),
         _ConfigSpec(
             filename="config_theme.yml",
@@ -351,8 +358,39 @@ class ConfigLoader:
         self.config_folder = Path(config_folder)
         self.configs: Dict[str, Any] = {}
 
+    def _cache_path(self, filename: str) -> Path:
+        """Path of the JSON parse result for a YAML file."""
+        return self.config_folder / ".cache" / f"{filename}.json"
+
+    def _read_cache(self, filename: str, source_key: tuple) -> Any:
+        """Return the cached parse of a YAML file, or None if missing or stale."""
+        try:
+            with self._cache_path(filename).open("r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except Exception:
+            return None
+        if not isinstance(cached, dict) or cached.get("key") != list(source_key):
+            return None
+        return cached.get("data")
+
+    def _write_cache(self, filename: str, source_key: tuple, data: Any) -> None:
+        """Store a YAML parse result keyed on the source file's mtime and size."""
+        try:
+            encoded = json.dumps({"key": list(source_key), "data": data})
+        except (TypeError, ValueError):
+            return  # e.g. YAML dates; just parse the file next time
+        # Non-string keys would come back as strings; only cache exact round-trips
+        if json.loads(encoded)["data"] != data:
+            return
+        cache_path = self._cache_path(filename)
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            cache_path.write_text(encoded, encoding="utf-8")
+        except Exception as e:
+            print(f"WARNING: Could not cache {filename}: {e}")
+
     def _load_yaml(self, filename: str, required: bool = True) -> Optional[dict]:
-        """Load a YAML file with error handling"""
+        """Load a YAML file with error handling, reusing the parse cache when fresh"""
         filepath = self.config_folder / filename
 
         if not filepath.exists():
@@ -361,16 +399,25 @@ class ConfigLoader:
             print(f"WARNING: {filepath} not found. Using defaults.")
             return None
 
+        stat = filepath.stat()
+        source_key = (stat.st_mtime_ns, stat.st_size)
+        data = self._read_cache(filename, source_key)
+        if data is not None:
+            print(f"[OK] Loaded {filename} (cached)")
+            return data
+
         try:
-            with filepath.open(encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                print(f"[OK] Loaded {filename}")
-                return data
+            # Hand the raw bytes to the parser; it detects the encoding itself
+            data = yaml.load(filepath.read_bytes(), Loader=YamlLoader)
+            print(f"[OK] Loaded {filename}")
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing YAML in {filepath}: {e}")
         except Exception as e:
             raise RuntimeError(f"Error loading {filepath}: {e}")
 
+        self._write_cache(filename, source_key, data)
+        return data
+
     def _ensure_from_template(self, filename: str) -> None:
         """Copy <filename>.template to <filename> if the live file does not exist."""
         live = self.config_folder / filename
@@ -425,19 +472,32 @@ class ConfigLoader:
 
         print("\n=== Loading Configuration Files ===")
         self._load_settings()
-        self._load_ui_config()
-        for spec in self._REGISTRY:
-            self._load_spec(spec)
+        # Each YAML file is an independent read + parse, so overlap them in a
+        # small thread pool. Every loader writes to its own key in self.configs.
+        # Required files stay eager so a missing/invalid one fails at startup
+        eager_specs = [
+            spec for spec in self._REGISTRY if spec.required or not spec.lazy
+        ]
+        with ThreadPoolExecutor(max_workers=len(eager_specs) + 1) as pool:
+            futures = [pool.submit(self._load_ui_config)]
+            futures += [pool.submit(self._load_spec, spec) for spec in eager_specs]
+            for future in futures:
+                future.result()
         print("=== Configuration Loading Complete ===\n")
         return self.configs
 
     def get(self, key: str) -> Any:
-        """Get a specific configuration"""
+        """Get a specific configuration, loading lazy specs on first access"""
+        if key not in self.configs:
+            for spec in self._REGISTRY:
+                if spec.key == key and spec.lazy and not spec.required:
+                    self._load_spec(spec)
+                    break
         return self.configs.get(key)
 
     def get_raw_dict(self, key: str) -> dict:
         """Get configuration as raw dictionary (for backward compatibility)"""
-        config = self.configs.get(key)
+        config = self.get(key)
         if config is None:
             return {}
         if isinstance(config, BaseModel):
@@ -86,7 +86,7 @@ class AppCore:
 
     @property
     def devops_tags_config(self):
-        return self.config_loader.configs["devops_tags"]
+        return self.config_loader.get("devops_tags")
 
     # ── Logging ───────────────────────────────────────────────────────────────
 
@@ -182,13 +182,15 @@ class AppCore:
             self.query_engine = QueryEngine(
                 file_name=self.settings.db_path, log_engine=db_logger
             )
-            await self.query_engine.refresh()
-            self.logger.info("Query engine initialized")
-
             self.add_data_engine = AddData(
                 query_engine=self.query_engine, log_engine=self.logger
             )
-            await self.add_data_engine.refresh()
+
+            # Both refreshes are independent reads - overlap them
+            await asyncio.gather(
+                self.query_engine.refresh(), self.add_data_engine.refresh()
+            )
+            self.logger.info("Query engine initialized")
             self.logger.info("Data engine initialized")
 
             self._initialized = True
@@ -260,11 +262,17 @@ class AppCore:
 
             if not self.devops_engine:
                 try:
-                    from ..globals import DevOpsEngine
+                    from ..globals import DevOpsEngine, QueryEngine
 
                     do_logger = self._setup_logger("DevOps")
+                    # The engine is shared process-wide and outlives this
+                    # client, so it gets its own connections rather than
+                    # borrowing this client's (closed on disconnect)
                     self.devops_engine = DevOpsEngine(
-                        query_engine=self.query_engine, log_engine=do_logger
+                        query_engine=QueryEngine(
+                            file_name=self.settings.db_path, log_engine=do_logger
+                        ),
+                        log_engine=do_logger,
                     )
                 except Exception as e:
                     self.logger.warning(f"Could not create DevOps engine: {e}")
@@ -373,6 +381,10 @@ class AppCore:
                         task.cancel()
             core._background_tasks.clear()
             _app_cores.pop(client_id, None)
+            # Release this client's DB connections; the shared DevOps engine
+            # has its own query engine, so nothing else uses them
+            if core.query_engine is not None:
+                asyncio.create_task(core.query_engine.close())
             core.logger.debug(f"Client {client_id} disconnected, core cleaned up")
 
         context.client.on_disconnect(cleanup)
@@ -31,13 +31,22 @@ class EventBusLogHandler(logging.Handler):
     def __init__(self, event_bus: "EventBus"):
         super().__init__()
         self.event_bus = event_bus
+        # (whole second, formatted timestamp) - log bursts share one strftime
+        self._ts_cache = (None, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        second = int(created)
+        if self._ts_cache[0] != second:
+            self._ts_cache = (
+                second,
+                datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        return self._ts_cache[1]
 
     def emit(self, record: logging.LogRecord):
         """Emit a log record to the event bus"""
         try:
-            timestamp = datetime.fromtimestamp(record.created).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+            timestamp = self._format_timestamp(record.created)
             # Mark record as forwarded so other handlers can skip duplicates
             try:
                 record.__dict__["forwarded_to_ui"] = True
@@ -166,19 +175,33 @@ class EventBus:
                 except Exception as e:
                     self.logger.error(f"Error in handler for '{event_name}': {e}")
 
-        # Execute in UI context — but only when we're already on the UI thread.
-        # If called from a background thread, the NiceGUI slot stack is empty and
-        # entering _ui_context would corrupt it.  In that case, schedule directly.
+        # Execute in UI context — but only when we're already on the UI loop.
+        # Worker threads may run their own loop (BaseService.run_in_thread);
+        # a task created there would touch UI elements off the UI thread, so
+        # anything not on the main loop is marshalled over to it.
         try:
-            asyncio.get_running_loop()
-            # We're on the UI/async thread — safe to use the context manager.
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        if current_loop is not None and (
+            current_loop is self._main_loop or self._main_loop is None
+        ):
+            # We're on the UI/async thread (or have no main loop to hand off
+            # to) — safe to use the context manager.
             with self._ui_context:
                 asyncio.create_task(execute_handlers())
-        except RuntimeError:
-            # Background thread: no running loop here.
+        else:
+            # Background thread or worker loop: hand off to the main loop.
             if self._main_loop and self._main_loop.is_running():
+
+                async def execute_in_ui_context():
+                    # Entered on the main loop, where the slot stack is valid
+                    with self._ui_context:
+                        await execute_handlers()
+
                 asyncio.run_coroutine_threadsafe(
-                    execute_handlers(), self._main_loop
+                    execute_in_ui_context(), self._main_loop
                 )
             else:
                 try:
@@ -211,21 +234,34 @@ class EventBus:
             except Exception as e:
                 self.logger.error(f"Error running function in UI context: {e}")
 
-        with self._ui_context:
-            try:
-                # If a running loop exists in this thread, schedule as a task
-                asyncio.get_running_loop()
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        # Only schedule locally on the UI loop; worker-thread loops hand off
+        if current_loop is not None and (
+            current_loop is self._main_loop or self._main_loop is None
+        ):
+            with self._ui_context:
                 asyncio.create_task(execute())
-            except RuntimeError:
-                if self._main_loop and self._main_loop.is_running():
-                    asyncio.run_coroutine_threadsafe(execute(), self._main_loop)
-                else:
-                    try:
-                        asyncio.run(execute())
-                    except Exception as e:
-                        self.logger.error(
-                            f"Failed to execute function synchronously in UI context: {e}"
-                        )
+        elif self._main_loop and self._main_loop.is_running():
+
+            async def execute_in_ui_context():
+                with self._ui_context:
+                    await execute()
+
+            asyncio.run_coroutine_threadsafe(
+                execute_in_ui_context(), self._main_loop
+            )
+        else:
+            try:
+                with self._ui_context:
+                    asyncio.run(execute())
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to execute function synchronously in UI context: {e}"
+                )
 
     def notify(
         self,
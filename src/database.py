@@ -1,4 +1,6 @@
 import sqlite3
+import threading
+from pathlib import Path
 from textwrap import dedent
 from typing import Literal
 import pandas as pd
@@ -10,6 +12,17 @@ class Database:
 
     def __init__(self, db_file: str, log_engine):
         self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        # WAL lets the read-only connections below run alongside a pending
+        # write instead of blocking on the rollback journal lock.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.db_file = db_file
+        # Read-only connections, one per worker thread, so concurrent SELECTs
+        # don't queue behind the shared write connection.
+        self._read_local = threading.local()
+        self._read_conns = []
+        self._read_conns_lock = threading.Lock()
+        self._closed = False
         Database.db = self
         self.log_engine = log_engine
 
@@ -1113,11 +1126,10 @@ class Database:
         elif mode == "merge":
             self.log_engine.info(f"Merging {len(df)} devops records")
             cursor = self.conn.cursor()
-            for _, row in df.iterrows():
-                cursor.execute(
-                    "delete from devops where customer_name = ? and id = ?",
-                    (row["customer_name"], row["id"]),
-                )
+            cursor.executemany(
+                "delete from devops where customer_name = ? and id = ?",
+                zip(df["customer_name"].tolist(), df["id"].tolist()),
+            )
             # Append the new/updated records
             df.to_sql("devops", self.conn, if_exists="append", index=False)
 
@@ -1161,10 +1173,15 @@ class Database:
                 round(ct.total_time, 2) as total_time,
                 round(ct.user_bonus, 2) as user_bonus,
                 c.sort_order as customer_sort_order,
-                p.sort_order as project_sort_order
+                p.sort_order as project_sort_order,
+                ifnull(p.git_id, 0) as git_id,
+                case when r.project_id is not null then 1 else 0 end as is_active
             from calculated_time ct
             join customers c on c.customer_id = ct.customer_id
             join projects p on p.project_id = ct.project_id
+            left join (
+                select distinct customer_id, project_id from time where end_time is null
+            ) r on r.customer_id = ct.customer_id and r.project_id = ct.project_id
             order by c.sort_order, ct.customer_name, p.sort_order, ct.project_name;
             """,
             (start_date, end_date),
@@ -1610,9 +1627,18 @@ class Database:
         return "\n".join(result) if result else "Schemas are identical!"
 
     @staticmethod
-    def generate_sync_sql(main_db_path, uploaded_db_path):
+    def generate_sync_sql(main_db_path, uploaded_db):
+        """
+        Build the SQL needed to bring an uploaded database's schema in line
+        with the main one. uploaded_db is a file path or an open connection
+        (e.g. an in-memory database deserialized from an upload); a passed-in
+        connection is closed when done.
+        """
         conn_main = sqlite3.connect(main_db_path)
-        conn_uploaded = sqlite3.connect(uploaded_db_path)
+        if isinstance(uploaded_db, sqlite3.Connection):
+            conn_uploaded = uploaded_db
+        else:
+            conn_uploaded = sqlite3.connect(uploaded_db)
         try:
             cursor_main = conn_main.cursor()
             cursor_uploaded = conn_uploaded.cursor()
@@ -1675,15 +1701,11 @@ class Database:
                 sql_statements.append(f"drop table if exists {table};")
 
             # Remove extra triggers
-            cursor_uploaded.execute("select name from sqlite_master where type='trigger';")
-            uploaded_triggers = set(row[0] for row in cursor_uploaded.fetchall())
             extra_triggers = uploaded_triggers - set(main_triggers.keys())
             for trigger in extra_triggers:
                 sql_statements.append(f"drop trigger if exists {trigger};")
 
             # Remove extra indexes
-            cursor_uploaded.execute("select name from sqlite_master where type='index';")
-            uploaded_indexes = set(row[0] for row in cursor_uploaded.fetchall())
             extra_indexes = uploaded_indexes - set(main_indexes.keys())
             for idx in extra_indexes:
                 sql_statements.append(f"drop index if exists {idx};")
@@ -1732,8 +1754,16 @@ class Database:
             raise
 
     def fetch_query(self, query: str, params: tuple = ()):
+        # Inside run_read() this thread's read-only connection is used; write
+        # helpers keep reading through the shared connection so they see
+        # their own pending changes.
+        conn = (
+            self._read_conn()
+            if getattr(self._read_local, "reading", False)
+            else self.conn
+        )
         try:
-            return pd.read_sql(query, self.conn, params=params)
+            return pd.read_sql(query, conn, params=params)
         except Exception as e:
             self.log_engine.error(f"Error fetching query: {query}\n{e}")
             raise
@@ -1757,6 +1787,46 @@ class Database:
             self.log_engine.error(f"Error running query: {query}\n{e}")
             raise
 
+    def _read_conn(self) -> sqlite3.Connection:
+        """Return this thread's read-only connection, opening it on first use."""
+        conn = getattr(self._read_local, "conn", None)
+        if conn is None:
+            uri = Path(self.db_file).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, timeout=5)
+            with self._read_conns_lock:
+                if self._closed:
+                    conn.close()
+                    raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+                # Tracked centrally so close() can reach every worker's connection
+                self._read_conns.append(conn)
+            self._read_local.conn = conn
+        return conn
+
+    def run_read(self, func, *args, **kwargs):
+        """
+        Call a read helper (e.g. get_customer_ui_list) with its fetch_query
+        calls served from the calling thread's read-only connection.
+        """
+        self._read_local.reading = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._read_local.reading = False
+
+    def read_query(self, query: str, params: tuple = ()):
+        """
+        Run a read-only query on the calling thread's pooled connection and
+        return a DataFrame.
+        """
+        try:
+            cursor = self._read_conn().execute(query, params)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description or ()]
+            return pd.DataFrame(rows, columns=columns)
+        except Exception as e:
+            self.log_engine.error(f"Error running query: {query}\n{e}")
+            raise
+
     def _get_value_from_db(
         self, query: str, params: tuple = (), data_type: Literal["str", "int", "float"] = "str"
     ):
@@ -1777,6 +1847,17 @@ class Database:
             raise ValueError("Invalid data type specified.")
 
     def close(self):
+        """Close the write connection and every thread's read connection."""
+        with self._read_conns_lock:
+            if self._closed:
+                return
+            self._closed = True
+            read_conns, self._read_conns = self._read_conns, []
+        for conn in read_conns:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                self.log_engine.warning(f"Error closing read connection: {e}")
         self.conn.close()
 
     def update_data_from_query(self, **kwargs):
@@ -1785,26 +1866,25 @@ class Database:
         pk_col = pk_data[0]
         pk = pk_data[1]
 
-        ## Specific logic for 'time' table to get project_id from project_name and customer_id
-        if table_name == "time":
-            customer_id = self._get_value_from_db(
-                "select customer_id from time where time_id = ?",
-                (pk,),
-                data_type="int",
-            )
-            project_id = self._get_value_from_db(
-                "select project_id from projects where project_name = ? and customer_id = ?",
-                (kwargs.get("project_name"), customer_id),
-                data_type="int",
-            )
-            kwargs.pop("project_name")
-            kwargs["project_id"] = project_id
+        # Only re-resolve project_id when the edit actually supplies a project_name
+        resolve_project = table_name == "time" and "project_name" in kwargs
+        project_name = kwargs.pop("project_name") if resolve_project else None
 
         update_fields = [k for k in kwargs if k not in ("table_name", "pk_data")]
-        set_clause = ", ".join([f"{field} = ?" for field in update_fields])
+        set_parts = [f"{field} = ?" for field in update_fields]
         values = [kwargs[field] for field in update_fields]
+
+        ## Specific logic for 'time' table: resolve project_id from project_name and the
+        ## row's own customer_id inside the update, so the edit is a single statement
+        if resolve_project:
+            set_parts.append(
+                "project_id = ifnull((select p.project_id from projects p "
+                "where p.project_name = ? and p.customer_id = time.customer_id), 0)"
+            )
+            values.append(project_name)
+
         values.append(pk)
-        query = f"update {table_name} set {set_clause} where {pk_col} = ?"
+        query = f"update {table_name} set {', '.join(set_parts)} where {pk_col} = ?"
         self.execute_query(query, tuple(values))
 
     def get_query_edit_data(self, table_name: str, pk: int):
@@ -22,22 +22,22 @@ class DevOpsManager:
     def __init__(self, df, log):
         self.clients = {}
         self.log = log
-        for _, row in df.iterrows():
-            if row["org_url"].lower() in ("", "none", "null") or row[
-                "pat_token"
-            ].lower() in ("", "none", "null"):
+        for row in df.itertuples(index=False):
+            if row.org_url.lower() in ("", "none", "null") or row.pat_token.lower() in (
+                "",
+                "none",
+                "null",
+            ):
                 continue
-            org_url = f"https://dev.azure.com/{row['org_url']}"
-            client = DevOpsClient(row["pat_token"], org_url, self.log)
+            org_url = f"https://dev.azure.com/{row.org_url}"
+            client = DevOpsClient(row.pat_token, org_url, self.log)
             try:
                 client.connect()
-                self.clients[row["customer_name"]] = client
-                self.log.info(
-                    f"Connected to DevOps for customer {row['customer_name']}"
-                )
+                self.clients[row.customer_name] = client
+                self.log.info(f"Connected to DevOps for customer {row.customer_name}")
             except Exception as e:
                 self.log.error(
-                    f"DevOps connection failed for {row['customer_name']}:\n{e}"
+                    f"DevOps connection failed for {row.customer_name}:\n{e}"
                 )
 
     def _get_client(self, customer_name):
@@ -159,64 +159,31 @@ class DevOpsManager:
             if not status or not items:
                 continue
 
-            # Build lookup dicts for hierarchy
-            epics = {
-                item.id: item
-                for item in items
-                if getattr(item, "fields", {}).get("System.WorkItemType") == "Epic"
-            }
-            features = {
-                item.id: item
-                for item in items
-                if getattr(item, "fields", {}).get("System.WorkItemType") == "Feature"
-            }
-            user_stories = {
-                item.id: item
-                for item in items
-                if getattr(item, "fields", {}).get("System.WorkItemType")
-                == "User Story"
-            }
-
-            # Add all epics
-            for epic in epics.values():
-                rows.append(
-                    {
-                        "customer_name": customer_name,
-                        "type": "Epic",
-                        "id": epic.id,
-                        "title": epic.fields.get("System.Title"),
-                        "state": epic.fields.get("System.State"),
-                        "parent_id": None,
-                    }
-                )
-
-            # Add all features
-            for feature in features.values():
-                parent_id = feature.fields.get("System.Parent")
-                rows.append(
-                    {
-                        "customer_name": customer_name,
-                        "type": "Feature",
-                        "id": feature.id,
-                        "title": feature.fields.get("System.Title"),
-                        "state": feature.fields.get("System.State"),
-                        "parent_id": parent_id,
-                    }
-                )
-
-            # Add all user stories
-            for us in user_stories.values():
-                parent_id = us.fields.get("System.Parent")
-                rows.append(
+            # Bucket items by type in one pass; rows keep the Epic -> Feature -> User Story order
+            by_type = {"Epic": [], "Feature": [], "User Story": []}
+            seen = set()
+            for item in items:
+                fields = getattr(item, "fields", {})
+                item_type = fields.get("System.WorkItemType")
+                bucket = by_type.get(item_type)
+                if bucket is None or (item_type, item.id) in seen:
+                    continue
+                seen.add((item_type, item.id))
+                bucket.append(
                     {
                         "customer_name": customer_name,
-                        "type": "User Story",
-                        "id": us.id,
-                        "title": us.fields.get("System.Title"),
-                        "state": us.fields.get("System.State"),
-                        "parent_id": parent_id,
+                        "type": item_type,
+                        "id": item.id,
+                        "title": fields.get("System.Title"),
+                        "state": fields.get("System.State"),
+                        # Epics are top level; their parent is never stored
+                        "parent_id": None
+                        if item_type == "Epic"
+                        else fields.get("System.Parent"),
                     }
                 )
+            for bucket in by_type.values():
+                rows.extend(bucket)
 
         df = pd.DataFrame(rows)
         return (True, df)
@@ -1,8 +1,10 @@
 # pandas removed from globals.py -- use local imports where needed
 from .devops import DevOpsManager
 from .database import Database
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import asyncio
+import functools
 import logging
 import datetime
 
@@ -12,6 +14,29 @@ import datetime
 _devops_scheduled_started: bool = False
 
 
+# Dedicated DB executors: reads fan out (each worker keeps its own read-only
+# connection), writes are serialised on a single worker since sqlite allows
+# one writer at a time anyway.
+_DB_READ_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="wt-db")
+_DB_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wt-db-write")
+# Only known read helpers use the read pool; anything else (including
+# generic helpers like execute_query) may write and goes to the writer.
+_DB_READ_PREFIXES = ("get_", "fetch_", "read_")
+
+
+async def _run_bg(executor, func, *args, **kwargs):
+    """
+    Run a blocking call in the given executor.
+
+    Like asyncio.to_thread but without copying the contextvars context;
+    the database calls routed through here don't read any.
+    """
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    return await loop.run_in_executor(executor, func, *args)
+
+
 @dataclass
 class SaveData:
     function: str
@@ -27,17 +52,37 @@ class QueryEngine:
         self.db = Database(file_name, log_engine)
         self.db.initialize_db()
         self.df = None
+        self.preset_query_names = []
+        self.custom_query_names = []
+        self.query_sql_by_name = {}
         self.log = log_engine
 
     async def function_db(self, func_name: str, *args, **kwargs):
         func = getattr(self.db, func_name)
-        return await asyncio.to_thread(func, *args, **kwargs)
+        if func_name.startswith(_DB_READ_PREFIXES):
+            # Read helpers run on the pool thread's own read-only connection
+            return await _run_bg(
+                _DB_READ_EXECUTOR, self.db.run_read, func, *args, **kwargs
+            )
+        return await _run_bg(_DB_WRITE_EXECUTOR, func, *args, **kwargs)
 
     async def query_db(self, query: str, params: tuple = ()):
-        return await asyncio.to_thread(self.db.smart_query, query, params)
+        # Plain SELECTs go to the per-thread read pool; anything else may write
+        # and stays on the shared connection.
+        if query.lstrip()[:6].lower() == "select":
+            return await _run_bg(_DB_READ_EXECUTOR, self.db.read_query, query, params)
+        return await _run_bg(_DB_WRITE_EXECUTOR, self.db.smart_query, query, params)
+
+    async def close(self):
+        # Queue behind any pending writes so they land before the connection goes
+        await _run_bg(_DB_WRITE_EXECUTOR, self.db.close)
 
     async def refresh(self):
         self.df = await self.function_db("get_query_list")
+        is_default = self.df["is_default"] == 1
+        self.preset_query_names = self.df.loc[is_default, "query_name"].tolist()
+        self.custom_query_names = self.df.loc[~is_default, "query_name"].tolist()
+        self.query_sql_by_name = dict(zip(self.df["query_name"], self.df["query_sql"]))
 
 
 class AddData:
@@ -54,6 +99,10 @@ class DevOpsEngine:
     def __init__(self, query_engine: QueryEngine, log_engine: logging.Logger):
         self.manager = None
         self.df = None
+        self.selector_options = {}
+        self.work_item_names = {}
+        self.parent_names = {}
+        self._df_fingerprint = None
         self.query_engine = query_engine
         self.log = log_engine
         self._scheduled_tasks = []
@@ -228,15 +277,87 @@ class DevOpsEngine:
             self.log.error(f"Error when updating the devops data: {devops_df}")
 
     async def load_df(self):
+        from pandas.util import hash_pandas_object
+
         df = await self.query_engine.query_db("select * from devops")
-        self.df = df if not df.empty else None
-        if self.df is None:
+        if df.empty:
+            self.df = None
+            self._df_fingerprint = None
+            self.selector_options = {}
+            self.work_item_names = {}
+            self.parent_names = {}
             self.log.warning("DevOps dataframe is empty")
-        else:
-            self.df["display_name"] = self.df.apply(
-                lambda row: f"{row['type']}: {int(row['id'])} - {row['title']}", axis=1
+            return
+
+        # Most scheduled refreshes append nothing; skip the rebuild if the
+        # table content is identical to what we already derived from.
+        fingerprint = (len(df), int(hash_pandas_object(df, index=False).sum()))
+        if self.df is not None and fingerprint == self._df_fingerprint:
+            self.log.info("DevOps dataframe unchanged, keeping cached data")
+            return
+
+        # Replaced tables can come back with REAL ids (NaN-padded parent_id);
+        # normalise to nullable ints once so consumers needn't cast per row
+        self.df = df.astype({"id": "Int64", "parent_id": "Int64"})
+        self._df_fingerprint = fingerprint
+        self.df["display_name"] = (
+            self.df["type"].astype(str)
+            + ": "
+            + self.df["id"].astype(str)
+            + " - "
+            + self.df["title"].astype(str)
+        )
+        # Few distinct values, filtered on constantly - compare codes, not strings
+        for col in ("customer_name", "state", "type"):
+            self.df[col] = self.df[col].astype("category")
+        self._build_selector_options()
+        self._build_name_lookups()
+        self.log.info(f"DevOps dataframe loaded with {len(self.df)} rows")
+
+    def _build_selector_options(self):
+        """Precompute the open work items per customer used by the time entry dialog."""
+        if self.df is None:
+            self.selector_options = {}
+            return
+        open_items = self.df[self.df["state"].isin({"Active", "New"})]
+        self.selector_options = {
+            customer: group[["display_name", "id"]].dropna().reset_index(drop=True)
+            for customer, group in open_items.groupby("customer_name", observed=True)
+        }
+
+    def _build_name_lookups(self):
+        """Precompute work item and parent names per customer used by the DevOps forms."""
+
+        def names_by_customer(df):
+            return (
+                df.groupby("customer_name", sort=False, observed=True)["display_name"]
+                .agg(list)
+                .to_dict()
             )
-            self.log.info(f"DevOps dataframe loaded with {len(self.df)} rows")
+
+        self.work_item_names = names_by_customer(self.df)
+        epics = names_by_customer(self.df[self.df["type"] == "Epic"])
+        features = names_by_customer(self.df[self.df["type"].isin({"Epic", "Feature"})])
+        self.parent_names = {
+            customer: {
+                "Epic": [],
+                "Feature": epics.get(customer, []),
+                "User Story": features.get(customer, []),
+            }
+            for customer in self.df["customer_name"].unique().tolist()
+        }
+
+    def get_selector_options(self, customer_name: str):
+        """
+        Get the open (Active/New) work items for a customer.
+
+        Args:
+            customer_name: Name of the customer
+
+        Returns:
+            DataFrame with display_name and id columns, or None if the customer has no open items
+        """
+        return self.selector_options.get(customer_name)
 
     def devops_helper(self, func_name: str, customer_name: str, *args, **kwargs):
         if not self.manager:
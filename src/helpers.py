@@ -6,12 +6,14 @@ from nicegui import ui
 from datetime import date, timedelta
 from typing import Callable
 import re
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 import markdown as _markdown
 import bleach as _bleach
 from markdownify import markdownify as _markdownify
 from pygments.formatters import HtmlFormatter as _HtmlFormatter
+from .config import YamlLoader
 
 
 # ===== UI STYLE MANAGER =====
@@ -37,7 +39,7 @@ class UIStyles:
                 os.path.dirname(__file__), "..", "config", "config_ui_styles.yml"
             )
             with open(config_path, "r") as f:
-                UIStyles._styles = yaml.safe_load(f)
+                UIStyles._styles = yaml.load(f, Loader=YamlLoader)
             UIStyles._resolved = UIStyles._styles  # default: unresolved fallback
 
     @classmethod
@@ -413,8 +415,12 @@ def get_range_for(option: str) -> str:
     Returns:
         Formatted date range string "start - end"
     """
-    today = date.today()
+    # Keyed on today's date so cached ranges roll over at midnight
+    return _range_for(option, date.today())
 
+
+@lru_cache(maxsize=64)
+def _range_for(option: str, today: date) -> str:
     if option == "Day":
         return f"{today} - {today}"
 
@@ -454,7 +460,11 @@ def parse_date_range(date_range_str: str) -> tuple[str | None, str | None]:
     """
     if not date_range_str:
         return None, None
+    return _parse_date_range(date_range_str.strip())
+
 
+@lru_cache(maxsize=64)
+def _parse_date_range(date_range_str: str) -> tuple[str | None, str | None]:
     match = re.match(
         r"(\d{4}-?\d{2}-?\d{2})\s*-\s*(\d{4}-?\d{2}-?\d{2})", date_range_str
     )
@@ -1723,7 +1733,12 @@ def bind_parent_relations(
             needs_polling = child_ftype in ["html", "markdown"]
 
             if not attached or needs_polling:
-                if field_config.get("parent_update", False):
+                if field_config.get("parent_update", False) and hasattr(
+                    parent_widget, "on_value_change"
+                ):
+                    # Value elements report changes themselves - no need to poll
+                    parent_widget.on_value_change(update_handler)
+                elif field_config.get("parent_update", False):
                     try:
                         last = {"value": getattr(parent_widget, "value", None)}
 
@@ -6,9 +6,12 @@ Uses V2 architecture with per-client AppCore and event-driven updates.
 Fully config-driven using config_ui.yml structure.
 """
 
-import os
+import asyncio
+import io
+import shutil
 import sqlite3
 import tempfile
+import time
 import pandas as pd
 from datetime import date
 from nicegui import ui, events
@@ -23,6 +26,9 @@ from ..ui.elements import (
     entity_card_content,
 )
 
+# Data sources / tab refreshes younger than this are reused instead of re-queried
+REFRESH_TTL_SECONDS = 1.0
+
 
 async def add_data_page():
     """Add Data page - for creating new entities
@@ -34,6 +40,11 @@ async def add_data_page():
     core = await AppCore.get_or_initialize()
 
     add_data_page_config = core.ui_config.get("add_data_page", {})
+    # Tab meta is static for the page build - read it once for the toolbar and panels
+    tab_meta = {
+        page_dict: page_section.get("meta", {})
+        for page_dict, page_section in add_data_page_config.items()
+    }
 
     BUILD_FUNCTIONS = {
         "render_entity_tabs": render_entity_tabs,
@@ -54,8 +65,7 @@ async def add_data_page():
                 )
                 .classes(helpers.UI_STYLES.get_layout_classes("tab_label"))
             ) as main_tabs:
-                for page_dict, page_section in add_data_page_config.items():
-                    p_data = page_section.get("meta", {})
+                for page_dict, p_data in tab_meta.items():
                     icon = p_data.get("icon", "warning")
                     label = p_data.get("friendly_name", page_dict)
                     ui.tab(page_dict, label=label, icon=icon)
@@ -64,9 +74,40 @@ async def add_data_page():
 
     main_tabs = render_toolbar()
 
-    # Wire up tab change to trigger refresh
+    # Tab panels are built on first activation; refresh fns from a previous render are stale
+    core._entity_refresh_fns = {}
+    tab_panel_refs = {}
+    built_tabs = set()
+    last_tab_refresh = {}
+
+    async def build_tab(page_dict):
+        """Build the content of a tab panel the first time it is shown."""
+        built_tabs.add(page_dict)
+        panel, build_fn, build_fn_name, options = tab_panel_refs[page_dict]
+
+        with panel:
+            if build_fn:
+                await build_fn(core, page_dict, options, add_data_page_config)
+            else:
+                core.logger.warning(
+                    f"No build function '{build_fn_name}' found for {page_dict}"
+                )
+                ui.label("Configuration error: build function not found").classes(
+                    "text-warning"
+                )
+
+    # Wire up tab change to build (first visit) or refresh the tab
     async def on_tab_change(e):
         tab_name = e.value
+        if tab_name in tab_panel_refs and tab_name not in built_tabs:
+            await build_tab(tab_name)
+            last_tab_refresh[tab_name] = time.monotonic()
+            return
+        # Skip the reload when the user is just flicking back and forth between tabs
+        now = time.monotonic()
+        if now - last_tab_refresh.get(tab_name, 0.0) < REFRESH_TTL_SECONDS:
+            return
+        last_tab_refresh[tab_name] = now
         # Refresh all forms in the newly visible tab
         if (
             hasattr(core, "_entity_refresh_fns")
@@ -92,26 +133,17 @@ async def add_data_page():
             "background: transparent;"
         )
     ):
-        for page_dict, page_section in add_data_page_config.items():
-            p_data = page_section.get("meta", {})
+        # Resolve each tab's builder once, when its panel is created
+        for page_dict, p_data in tab_meta.items():
             build_fn_name = p_data.get("build_function")
+            tab_panel_refs[page_dict] = (
+                ui.tab_panel(page_dict),
+                BUILD_FUNCTIONS.get(build_fn_name),
+                build_fn_name,
+                p_data.get("options", []),
+            )
 
-            with ui.tab_panel(page_dict):
-                if build_fn_name and build_fn_name in BUILD_FUNCTIONS:
-                    build_fn = BUILD_FUNCTIONS[build_fn_name]
-                    await build_fn(
-                        core,
-                        page_dict,
-                        p_data.get("options", []),
-                        add_data_page_config,
-                    )
-                else:
-                    core.logger.warning(
-                        f"No build function '{build_fn_name}' found for {page_dict}"
-                    )
-                    ui.label("Configuration error: build function not found").classes(
-                        "text-warning"
-                    )
+    await build_tab(start_tab)
 
 
 async def render_entity_tabs(
@@ -149,9 +181,11 @@ async def render_entity_form(
     widgets = {}
     dynamic_widgets = []
     parent_map = {}
+    data_cache = {"task": None, "at": 0.0}
+    # The form config is static - resolve what on_submit needs once
+    required_fields = [f["name"] for f in fields if not f.get("optional", False)]
 
     async def on_submit():  ## TODO somewhere here detect if DevOps was updated and trigger re-init if so (could also be done via event bus) core.force_devops_reinit()
-        required_fields = [f["name"] for f in fields if not f.get("optional", False)]
         if not helpers.check_input(widgets, required_fields):
             return
         kwargs = {name: widget.value for name, widget in widgets.items()}
@@ -209,8 +243,21 @@ async def render_entity_form(
 
         with entity_card_content():
 
+            async def get_data_sources() -> dict:
+                """Share one prepare_data_sources call across widgets refreshing together."""
+                now = time.monotonic()
+                if (
+                    data_cache["task"] is None
+                    or now - data_cache["at"] > REFRESH_TTL_SECONDS
+                ):
+                    data_cache["task"] = asyncio.create_task(
+                        prepare_data_sources(core, entity_type, operation)
+                    )
+                    data_cache["at"] = now
+                return await asyncio.shield(data_cache["task"])
+
             async def data_fetcher(source_key, parent_val=None):
-                fresh = await prepare_data_sources(core, entity_type, operation)
+                fresh = await get_data_sources()
                 if source_key not in fresh:
                     return [] if parent_val is not None else ""
                 data = fresh[source_key]
@@ -260,6 +307,7 @@ async def render_entity_form(
                     dynamic_widgets.append(dw)
 
     async def refresh_all_widgets():
+        data_cache["task"] = None  # Always re-read once per refresh pass
         try:
             for dw in dynamic_widgets:
                 await dw.refresh()
@@ -326,13 +374,14 @@ async def render_devops_form(core: AppCore, operation: str, form_config: dict):
     widgets: dict = {}
     dynamic_widgets: list = []
     parent_map: dict = {}
+    # The form config is static - resolve what on_submit needs once
+    required_fields = [
+        f.get("name") or f.get("field_id")
+        for f in fields
+        if not f.get("optional", False)
+    ]
 
     async def on_submit():
-        required_fields = [
-            f.get("name") or f.get("field_id")
-            for f in fields
-            if not f.get("optional", False)
-        ]
         if not helpers.check_input(widgets, required_fields):
             return
 
@@ -412,12 +461,12 @@ async def render_devops_form(core: AppCore, operation: str, form_config: dict):
                 return data
             return [] if parent_val is not None else ""
 
-        field_name_to_type = {f.get("name") or f.get("field_id"): f.get("type") for f in fields}
         fields_by_name = {f.get("name") or f.get("field_id"): f for f in fields}
         has_wide_layout = any(
-            helpers.UI_STYLES.is_wide_widget(field_name_to_type.get(fn))
+            helpers.UI_STYLES.is_wide_widget(fields_by_name[fn].get("type"))
             for row in rows_layout
             for fn in row
+            if fn in fields_by_name
         )
 
         with ui.column().classes(helpers.UI_STYLES.get_layout_classes("form_column")):
@@ -479,27 +528,21 @@ async def prepare_data_sources(core: AppCore, entity_type: str, operation: str)
     try:
         if entity_type == "customer":
             if operation in ["update", "disable"]:
-                # Get active customers
+                # Active customers plus their current values, in one read
                 df = await QE.query_db(
-                    "SELECT customer_name FROM customers WHERE is_current = 1"
-                )
-                data_sources["customer_data"] = (
-                    df["customer_name"].tolist() if not df.empty else []
+                    "SELECT customer_name, org_url, pat_token FROM customers WHERE is_current = 1"
                 )
+                cnames = df["customer_name"].tolist()
+                data_sources["customer_data"] = cnames
 
                 if operation == "update":
-                    # For update, we need current values per customer
-                    full_df = await QE.query_db(
-                        "SELECT customer_name, org_url, pat_token FROM customers WHERE is_current = 1"
+                    data_sources["org_url"] = dict(
+                        zip(cnames, df["org_url"].fillna("").tolist())
+                    )
+                    data_sources["pat_token"] = dict(
+                        zip(cnames, df["pat_token"].fillna("").tolist())
                     )
-                    data_sources["org_url"] = {}
-                    data_sources["pat_token"] = {}
-                    data_sources["new_customer_name"] = {}
-                    for _, row in full_df.iterrows():
-                        cname = row["customer_name"]
-                        data_sources["org_url"][cname] = row["org_url"] or ""
-                        data_sources["pat_token"][cname] = row["pat_token"] or ""
-                        data_sources["new_customer_name"][cname] = cname
+                    data_sources["new_customer_name"] = dict(zip(cnames, cnames))
 
             elif operation == "reenable":
                 # Get customers that are disabled and have no active entry
@@ -526,19 +569,23 @@ async def prepare_data_sources(core: AppCore, entity_type: str, operation: str)
                 df["customer_name"].tolist() if not df.empty else []
             )
 
+            def names_by_customer(df):
+                return (
+                    df.groupby("customer_name", sort=False)["project_name"]
+                    .agg(list)
+                    .to_dict()
+                )
+
             if operation in ["update", "disable"]:
-                # Get active projects grouped by customer (for parent-dependent dropdown)
-                grouped_df = await QE.query_db(
-                    """SELECT p.project_name, c.customer_name
+                # Active projects with their details in one read; grouped by
+                # customer for the parent-dependent dropdown
+                project_df = await QE.query_db(
+                    """SELECT p.project_name, p.git_id, c.customer_name
                        FROM projects p
                        JOIN customers c ON p.customer_id = c.customer_id
                        WHERE p.is_current = 1"""
                 )
-                project_names_by_cust: dict = {}
-                for _, row in grouped_df.iterrows():
-                    project_names_by_cust.setdefault(row["customer_name"], []).append(
-                        row["project_name"]
-                    )
+                project_names_by_cust = names_by_customer(project_df)
                 data_sources["project_names"] = project_names_by_cust
                 # Keep flat list for backward compat
                 data_sources["project_data"] = [
@@ -546,22 +593,11 @@ async def prepare_data_sources(core: AppCore, entity_type: str, operation: str)
                 ]
 
                 if operation == "update":
-                    # Get project details per project for auto-population
-                    full_df = await QE.query_db(
-                        """SELECT p.project_name, p.git_id
-                           FROM projects p
-                           WHERE p.is_current = 1"""
-                    )
-                    data_sources["new_project_name"] = {}
-                    data_sources["new_git_id"] = {}
-                    for _, row in full_df.iterrows():
-                        pname = row["project_name"]
-                        # Plain strings/numbers so _update_input_field sets correct values
-                        data_sources["new_project_name"][pname] = pname
-                        git_val = row["git_id"]
-                        data_sources["new_git_id"][pname] = (
-                            int(git_val) if pd.notna(git_val) else 0
-                        )
+                    # Plain strings/numbers so _update_input_field sets correct values
+                    pnames = project_df["project_name"].tolist()
+                    git_ids = project_df["git_id"].fillna(0).astype(int).tolist()
+                    data_sources["new_project_name"] = dict(zip(pnames, pnames))
+                    data_sources["new_git_id"] = dict(zip(pnames, git_ids))
 
             elif operation == "reenable":
                 # Disabled projects grouped by customer (excluding any now-active ones)
@@ -574,11 +610,7 @@ async def prepare_data_sources(core: AppCore, entity_type: str, operation: str)
                            SELECT project_name FROM projects WHERE is_current = 1
                        )"""
                 )
-                project_names_by_cust = {}
-                for _, row in dis_df.iterrows():
-                    project_names_by_cust.setdefault(row["customer_name"], []).append(
-                        row["project_name"]
-                    )
+                project_names_by_cust = names_by_customer(dis_df)
                 data_sources["project_names"] = project_names_by_cust
                 data_sources["project_data"] = [
                     p for lst in project_names_by_cust.values() for p in lst
@@ -621,32 +653,14 @@ async def prepare_devops_data_sources(core: AppCore, operation: str) -> dict:
         if not DO or not hasattr(DO, "df") or DO.df is None or DO.df.empty:
             return data_sources
 
-        # Get customer names from DevOps data
-        customer_names = DO.df["customer_name"].unique().tolist()
+        # Customer names from DevOps data (parent_names has one key per customer)
+        customer_names = list(DO.parent_names)
         data_sources["customer_data"] = customer_names
 
-        # Prepare work items and parent relationships per customer
-        work_items = {}
-        parent_names = {}
-
-        for customer in customer_names:
-            customer_df = DO.df[DO.df["customer_name"] == customer]
-            work_items[customer] = customer_df["display_name"].tolist()
-
-            # Parent relationships
-            epics = customer_df[customer_df["type"] == "Epic"]["display_name"].tolist()
-            features = customer_df[customer_df["type"].isin(["Epic", "Feature"])][
-                "display_name"
-            ].tolist()
-
-            parent_names[customer] = {
-                "Epic": [],
-                "Feature": epics,
-                "User Story": features,
-            }
-
-        data_sources["work_items"] = work_items
-        data_sources["parent_names"] = parent_names
+        # Work items and parent relationships are precomputed by the engine
+        # whenever the DevOps data changes
+        data_sources["work_items"] = DO.work_item_names
+        data_sources["parent_names"] = DO.parent_names
 
         # Load DevOps contacts config if available
         try:
@@ -697,6 +711,12 @@ async def render_database_tabs(
     # Get database name from settings
     db_name = core.settings.db_path
 
+    def save_upload_to_temp(e: events.UploadEventArguments) -> str:
+        """Stream an uploaded .db file to a temp file in 64 KiB chunks and return its path."""
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp:
+            shutil.copyfileobj(e.content, tmp, 64 * 1024)
+            return tmp.name
+
     with (
         ui.tabs()
         .props("inline-label align=left")
@@ -730,15 +750,27 @@ async def render_database_tabs(
                 def handle_upload(e: events.UploadEventArguments):
                     ui.notify(f"File uploaded: {e.name}", color="positive")
                     try:
-                        with tempfile.NamedTemporaryFile(
-                            delete=False, suffix=".db"
-                        ) as tmp:
-                            tmp.write(e.content.read())
-                            uploaded_path = tmp.name
+                        # Only the schema is compared - open the upload in memory
+                        # instead of round-tripping it through a temp file
+                        # Read straight into a mutable buffer (no extra copy)
+                        e.content.seek(0, io.SEEK_END)
+                        image = bytearray(e.content.tell())
+                        e.content.seek(0)
+                        e.content.readinto(image)
+                        # In-memory databases can't use WAL; header bytes 18/19
+                        # are 2 for WAL images, so mark them as rollback-journal
+                        if len(image) > 19 and image[18] == 2 and image[19] == 2:
+                            image[18] = image[19] = 1
+                        uploaded_conn = sqlite3.connect(":memory:")
+                        try:
+                            uploaded_conn.deserialize(image)
+                        except Exception:
+                            uploaded_conn.close()
+                            raise
 
-                        sync_sql = Database.generate_sync_sql(db_name, uploaded_path)
+                        # generate_sync_sql closes the connection when done
+                        sync_sql = Database.generate_sync_sql(db_name, uploaded_conn)
                         db_deltas.set_content(sync_sql)
-                        os.remove(uploaded_path)  # Clean up temp file
                     except Exception as ex:
                         core.logger.error(f"Error comparing databases: {ex}")
                         ui.notify(f"Error: {ex}", type="negative")
@@ -776,11 +808,7 @@ async def render_database_tabs(
                     nonlocal uploaded_db_path
                     ui.notify(f"Database uploaded: {e.name}", color="positive")
                     try:
-                        with tempfile.NamedTemporaryFile(
-                            delete=False, suffix=".db"
-                        ) as tmp:
-                            tmp.write(e.content.read())
-                            uploaded_db_path = tmp.name
+                        uploaded_db_path = save_upload_to_temp(e)
                         core.logger.info(
                             f"Database uploaded to: {uploaded_db_path}"
                         )
@@ -5,6 +5,7 @@ Display application logs with real-time updates via event bus.
 Uses per-client AppCore and event-driven updates.
 """
 
+import asyncio
 from datetime import datetime
 
 from nicegui import ui
@@ -14,6 +15,12 @@ from ..helpers import UI_STYLES
 from ..ui.elements import toolbar, toolbar_group, page_card
 from ..ui.keyboard_handlers import setup_debug_keyboard_handlers
 
+# Lines kept in the log widget; matches the size of the global log history,
+# so a long session stops growing the DOM once the history is full
+MAX_LOG_LINES = 2000
+# Incoming lines are collected and pushed to the widget at most this often
+LOG_FLUSH_SECONDS = 0.05
+
 
 async def log_page():
     """Log page - displays application logs
@@ -79,7 +86,7 @@ async def log_page():
 
     with page_card(scrollable=False):
         log_widget = (
-            ui.log(max_lines=None)
+            ui.log(max_lines=MAX_LOG_LINES)
             .classes(UI_STYLES.get_widget_style("log_textarea")["base"] + " flex-1")
             .style(
                 "min-height: 0; overflow-y: auto; overflow-x: auto; width: 100%; min-width: 100%;"
@@ -128,6 +135,30 @@ async def log_page():
         except Exception:
             pass
 
+        # Lines waiting for the next flush; bursts (e.g. a DevOps sync) become
+        # one batch of pushes instead of one UI update per record
+        pending_lines = []
+        # Records can be emitted from worker-thread loops (e.g. DevOps syncs);
+        # the flush must always run on the UI loop or it may never complete
+        ui_loop = asyncio.get_running_loop()
+
+        def schedule_flush():
+            ui_loop.create_task(flush_pending())
+
+        async def flush_pending():
+            await asyncio.sleep(LOG_FLUSH_SECONDS)
+            lines = pending_lines[:]
+            # Drop only what was taken; lines appended meanwhile stay queued
+            del pending_lines[: len(lines)]
+            for formatted, color in lines:
+                try:
+                    log_widget.push(formatted, classes=f"text-{color}")
+                except Exception:
+                    # Widget is dead/destroyed, ignore silently
+                    return
+            if pending_lines:
+                schedule_flush()
+
         # Register handler for NEW logs (only during this page visit)
         def on_new_log(
             message: str,
@@ -154,11 +185,10 @@ async def log_page():
 
             formatted = f"{timestamp} | {level:<8} | {logger:<9} :: {message}"
             color = log_colors.get(level, "white")
-            try:
-                log_widget.push(formatted, classes=f"text-{color}")
-            except Exception:
-                # Widget is dead/destroyed, ignore silently
-                pass
+            was_empty = not pending_lines
+            pending_lines.append((formatted, color))
+            if was_empty:
+                ui_loop.call_soon_threadsafe(schedule_flush)
 
         core.event_bus.register("log_message", on_new_log)
 
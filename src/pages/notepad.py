@@ -239,7 +239,7 @@ async def notepad_page():
     notes_dir = get_notes_dir()
     project_root = get_project_root()
     
-    note_config = core.config_loader.configs["notepad"]
+    note_config = core.config_loader.get("notepad")
     
     for col in note_config.note_colors:
         NOTE_COLORS[col] = {
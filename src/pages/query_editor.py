@@ -15,6 +15,15 @@ from ..ui.keyboard_handlers import setup_debug_keyboard_handlers
 from ..ui.elements import toolbar, toolbar_group, page_card, entity_card_header
 from ..ui.dynamic_widgets import WIDGET_CLASSES
 
+# Rows sent to the grid per batch when displaying large query results
+GRID_ROW_CHUNK = 1000
+
+
+def _grid_records(df) -> list[dict]:
+    """Row dicts for AG Grid; the column list is built once and shared by every row."""
+    cols = df.columns.tolist()
+    return [dict(zip(cols, row)) for row in df.itertuples(index=False, name=None)]
+
 
 async def query_editor_page():
     """Query Editor page - for running SQL queries
@@ -32,14 +41,9 @@ async def query_editor_page():
     LOG = core.logger
 
     if "query_editor_query" not in app.storage.user:
-        try:
-            app.storage.user["query_editor_query"] = (
-                QE.df[QE.df["query_name"] == "time"]["query_sql"].values[0]
-            )
-        except Exception:
-            app.storage.user["query_editor_query"] = (
-                "select * from time order by time_id desc limit 100"
-            )
+        app.storage.user["query_editor_query"] = QE.query_sql_by_name.get(
+            "time", "select * from time order by time_id desc limit 100"
+        )
 
     config_query = core.query_config if hasattr(core, "query_config") else {}
 
@@ -47,15 +51,14 @@ async def query_editor_page():
     # Helper Functions
     # ========================================================================
     def _get_custom_queries() -> list:
-        return QE.df[QE.df["is_default"] != 1]["query_name"].tolist()
+        return list(QE.custom_query_names)
 
     def _validate_query_name(name: str, check_exists: bool = False) -> bool:
         if not name or not name.strip():
             ui.notify("Query name required", type="warning")
             LOG.warning("Query name is required!")
             return False
-        existing = QE.df["query_name"].tolist()
-        if check_exists and name in existing:
+        if check_exists and name in QE.query_sql_by_name:
             ui.notify("Query name already exists", type="warning")
             LOG.warning(f"Query name '{name}' already exists!")
             return False
@@ -74,59 +77,108 @@ async def query_editor_page():
         await QE.refresh()
         render_query_buttons()
 
+    # Chips currently on screen, keyed by query name, so refreshes only touch the delta
+    rendered_chips = {"preset": {}, "custom": {}}
+    empty_custom_label = {"el": None}
+
     def render_query_buttons() -> None:
-        preset_queries.clear()
-        custom_queries.clear()
-        with preset_queries:
-            for _, row in QE.df[QE.df["is_default"] == 1].iterrows():
-                render_query_chip(row["query_name"], row["query_sql"])
-        with custom_queries:
-            custom_df = QE.df[QE.df["is_default"] != 1]
-            if custom_df.empty:
-                ui.label("No custom queries yet").classes(
+        sync_query_chips(preset_queries, rendered_chips["preset"], QE.preset_query_names)
+        custom_names = QE.custom_query_names
+        sync_query_chips(custom_queries, rendered_chips["custom"], custom_names)
+
+        if not custom_names and empty_custom_label["el"] is None:
+            with custom_queries:
+                empty_custom_label["el"] = ui.label("No custom queries yet").classes(
                     helpers.UI_STYLES.get_layout_classes("muted_text_xs_italic")
                 )
-            else:
-                for _, row in custom_df.iterrows():
-                    render_query_chip(row["query_name"], row["query_sql"])
-
-    def render_query_chip(query_name: str, query_sql: str) -> None:
+        elif custom_names and empty_custom_label["el"] is not None:
+            empty_custom_label["el"].delete()
+            empty_custom_label["el"] = None
+
+    def sync_query_chips(container, chips: dict, names: list) -> None:
+        """Delete chips for removed queries, add new ones, and keep them in `names` order."""
+        wanted = set(names)
+        for name in [n for n in chips if n not in wanted]:
+            chips.pop(name).delete()
+        with container:
+            for name in names:
+                if name not in chips:
+                    chips[name] = render_query_chip(name)
+        # New chips land at the end; move any out-of-place chip to its slot
+        children = container.default_slot.children
+        for i, name in enumerate(names):
+            chip = chips[name]
+            if i >= len(children) or children[i] is not chip:
+                chip.move(container, target_index=i)
+                children = container.default_slot.children
+
+    def render_query_chip(query_name: str):
         chip_style = helpers.UI_STYLES.get_widget_style("query_chip")
-        ui.button(query_name, on_click=lambda: editor.set_value(query_sql)).props(
-            "outline dense no-caps"
-        ).classes(chip_style["classes"]).style(chip_style["style"])
+        # Read the SQL at click time so updated queries need no re-render
+        return (
+            ui.button(
+                query_name,
+                on_click=lambda: editor.set_value(QE.query_sql_by_name.get(query_name, "")),
+            )
+            .props("outline dense no-caps")
+            .classes(chip_style["classes"])
+            .style(chip_style["style"])
+        )
 
     # ========================================================================
     # Query Functions
     # ========================================================================
 
+    # Save/update/delete share one dialog; it is built on first use and
+    # re-targeted on every open instead of creating a new one per click
+    query_dialog = {}
+
     def create_query_dialog(
         title: str, input_type: str, options: list = None, on_confirm=None
     ) -> None:
-        with ui.dialog() as popup:
-            with ui.card().classes(helpers.UI_STYLES.get_widget_width("standard")):
-                if input_type == "input":
-                    name_widget = ui.input("Query Name").classes(
+        if not query_dialog:
+            with ui.dialog() as popup:
+                with ui.card().classes(helpers.UI_STYLES.get_widget_width("standard")):
+                    name_input = ui.input("Query Name").classes(
                         helpers.UI_STYLES.get_layout_classes("full_width")
                     )
-                else:
-                    name_widget = ui.select(
-                        options=options or [], label="Existing Query"
+                    name_select = ui.select(
+                        options=[], label="Existing Query"
                     ).classes(helpers.UI_STYLES.get_layout_classes("full_width"))
 
-                async def on_button_click():
-                    await on_confirm(popup, name_widget.value)
+                    async def on_button_click():
+                        name_widget = (
+                            name_input
+                            if query_dialog["input_type"] == "input"
+                            else name_select
+                        )
+                        await query_dialog["on_confirm"](popup, name_widget.value)
+
+                    with ui.row().classes(
+                        helpers.UI_STYLES.get_layout_classes("full_row_between_centered")
+                    ):
+                        confirm_button = ui.button(
+                            title, on_click=on_button_click
+                        ).classes(helpers.UI_STYLES.get_layout_classes("button_fixed"))
+                        ui.button("Cancel", on_click=popup.close).props("flat").classes(
+                            helpers.UI_STYLES.get_layout_classes("button_fixed")
+                        )
+            query_dialog.update(
+                popup=popup,
+                input=name_input,
+                select=name_select,
+                button=confirm_button,
+            )
 
-                with ui.row().classes(
-                    helpers.UI_STYLES.get_layout_classes("full_row_between_centered")
-                ):
-                    ui.button(title, on_click=on_button_click).classes(
-                        helpers.UI_STYLES.get_layout_classes("button_fixed")
-                    )
-                    ui.button("Cancel", on_click=popup.close).props("flat").classes(
-                        helpers.UI_STYLES.get_layout_classes("button_fixed")
-                    )
-        popup.open()
+        query_dialog["input_type"] = input_type
+        query_dialog["on_confirm"] = on_confirm
+        is_input = input_type == "input"
+        query_dialog["input"].set_visibility(is_input)
+        query_dialog["input"].value = ""
+        query_dialog["select"].set_visibility(not is_input)
+        query_dialog["select"].set_options(options or [], value=None)
+        query_dialog["button"].set_text(title)
+        query_dialog["popup"].open()
 
     async def save_custom_query() -> None:
         query = editor.value
@@ -211,10 +263,26 @@ async def query_editor_page():
             "Delete", "select", options=custom_queries, on_confirm=perform_delete
         )
 
+    row_stream = {"task": None}
+    # Columns currently shown in the grid; re-running a query with the same
+    # shape only swaps the rows instead of rebuilding every column
+    grid_columns = {"signature": None}
+
+    async def stream_remaining_rows(df) -> None:
+        """Append result rows beyond the first chunk to the grid in batches."""
+        for start in range(GRID_ROW_CHUNK, len(df), GRID_ROW_CHUNK):
+            batch = _grid_records(df.iloc[start : start + GRID_ROW_CHUNK])
+            # Keep options in sync so a later grid_box.update() still shows every row
+            grid_box.options["rowData"].extend(batch)
+            grid_box.run_grid_method("applyTransaction", {"add": batch})
+            await asyncio.sleep(0)
+
     async def execute_query() -> None:
         query = editor.value
         if not query.strip():
             return
+        if row_stream["task"] and not row_stream["task"].done():
+            row_stream["task"].cancel()
         try:
             df = await QE.query_db(query)
             if df is not None:
@@ -243,12 +311,21 @@ async def query_editor_page():
                     }
                     for i, col in enumerate(df.columns)
                 ]
-                grid_box.options["columnDefs"] = column_defs
-
                 df.columns = unique_cols
-                row_data = df.to_dict(orient="records")
-                grid_box.options["rowData"] = row_data
-                grid_box.update()
+                # Render the first chunk right away and stream the rest in batches
+                first_rows = _grid_records(df.iloc[:GRID_ROW_CHUNK])
+                grid_box.options["rowData"] = first_rows
+                signature = (tuple(unique_cols), is_edit_mode)
+                if signature == grid_columns["signature"]:
+                    grid_box.run_grid_method("setGridOption", "rowData", first_rows)
+                else:
+                    grid_box.options["columnDefs"] = column_defs
+                    grid_columns["signature"] = signature
+                    grid_box.update()
+                if len(df) > GRID_ROW_CHUNK:
+                    row_stream["task"] = asyncio.create_task(
+                        stream_remaining_rows(df)
+                    )
 
                 # Auto-size columns to fit viewport - use run_method for proper context
                 try:
@@ -275,6 +352,7 @@ async def query_editor_page():
                     {"field": "info", "headerName": "Result"}
                 ]
                 grid_box.options["rowData"] = [{"info": msg}]
+                grid_columns["signature"] = None
                 grid_box.update()
         except Exception as e:
             error_msg = f"Query execution failed: {e}"
@@ -283,14 +361,39 @@ async def query_editor_page():
                 {"field": "error", "headerName": "❌ Error"}
             ]
             grid_box.options["rowData"] = [{"error": str(e)}]
+            grid_columns["signature"] = None
             grid_box.update()
 
     # ========================================================================
     # Table Cell Editing
     # ========================================================================
 
+    # Parsed table name for the current editor text; reused across cell clicks
+    table_name_cache = {"sql": None, "name": None}
+    # Per-table edit settings, resolved from the (static) query config on first use
+    table_plans = {}
+
+    def get_table_plan(table_name: str) -> dict:
+        plan = table_plans.get(table_name)
+        if plan is None:
+            table_config = config_query["query"][table_name]
+            fields = table_config["fields"]
+            plan = {
+                "primary_key": f"{table_name.rstrip('s')}_id",
+                "fields": fields,
+                "required_fields": [
+                    f["name"] for f in fields if not f.get("optional", False)
+                ],
+                "save_data": SaveData(**table_config["action"]),
+            }
+            table_plans[table_name] = plan
+        return plan
+
     async def show_row_edit_popup(row_data) -> None:
-        table_name = helpers.extract_table_name(editor.value)
+        if table_name_cache["sql"] != editor.value:
+            table_name_cache["sql"] = editor.value
+            table_name_cache["name"] = helpers.extract_table_name(editor.value)
+        table_name = table_name_cache["name"]
         if table_name not in ["time", "customers", "projects"]:
             ui.notify(
                 f"Table '{table_name}' is not registered for editing!", type="negative"
@@ -298,8 +401,8 @@ async def query_editor_page():
             LOG.warning(f"Table '{table_name}' is not editable!")
             return
 
-        base_name = table_name.rstrip("s")
-        primary_key = f"{base_name}_id"
+        plan = get_table_plan(table_name)
+        primary_key = plan["primary_key"]
         if primary_key not in row_data:
             ui.notify(
                 f"Cannot find primary key '{primary_key}' in your query!",
@@ -309,24 +412,30 @@ async def query_editor_page():
             return
 
         pk_data = (primary_key, row_data[primary_key])
-        table_row = await QE.function_db("get_query_edit_data", table_name, pk_data[1])
+        data_sources = {}
+        if table_name == "time":
+            # Resolve the row's customer inside the project query so both
+            # reads can run at the same time
+            table_row, projects = await asyncio.gather(
+                QE.function_db("get_query_edit_data", table_name, pk_data[1]),
+                QE.query_db(
+                    "SELECT project_name FROM projects WHERE is_current = 1 "
+                    "AND customer_id = (SELECT customer_id FROM time WHERE time_id = ?)",
+                    params=(pk_data[1],),
+                ),
+            )
+            data_sources["project_names"] = projects["project_name"].tolist()
+        else:
+            table_row = await QE.function_db(
+                "get_query_edit_data", table_name, pk_data[1]
+            )
         if table_row.empty:
             ui.notify("Row not found", type="negative")
             LOG.warning(f"Row with {primary_key}={pk_data[1]} not found!")
             return
         table_row = table_row.iloc[0]
 
-        data_sources = {}
-        if table_name == "time":
-            customer_id = int(table_row.get("customer_id", 0))
-            projects = await QE.query_db(
-                "SELECT project_name FROM projects WHERE customer_id = ? AND is_current = 1",
-                params=(customer_id,),
-            )
-            data_sources["project_names"] = projects["project_name"].tolist()
-
-        fields = config_query["query"][table_name]["fields"]
-        action = config_query["query"][table_name]["action"]
+        fields = plan["fields"]
 
         for field in fields:
             options_source = field.get("options_source")
@@ -337,15 +446,13 @@ async def query_editor_page():
 
         helpers.assign_dynamic_options(fields, data_sources=data_sources)
 
-        save_data = SaveData(**action)
+        save_data = plan["save_data"]
+        required_fields = plan["required_fields"]
         widgets = {}
         dynamic_widgets = []
         parent_map = {}
 
         async def on_submit():
-            required_fields = [
-                f["name"] for f in fields if not f.get("optional", False)
-            ]
             if not helpers.check_input(widgets, required_fields):
                 return
             kwargs = {name: widget.value for name, widget in widgets.items()}
@@ -417,10 +524,8 @@ async def query_editor_page():
                             parent_map.get(parent_field) if parent_field else None
                         )
 
-                        options_source = field.get("options_source")
-                        if options_source and options_source not in data_sources:
-                            data_sources[options_source] = table_row.get(options_source)
-                        if field["name"] in table_row:
+                        # data_sources was already filled for every options_source above
+                        if field_name in table_row:
                             field["default"] = table_row.get(field["name"])
 
                         widget_class = WIDGET_CLASSES.get(field_type)
@@ -535,52 +640,56 @@ async def query_editor_page():
 
             edit_mode_enabled.on("update:model-value", lambda _: on_edit_mode_change())
 
+            # QE.df is loaded at engine init and refreshed after every save/delete
             render_query_buttons()
-            asyncio.create_task(refresh_query_list())
 
         return edit_mode_enabled, editor, grid_box
 
     preset_queries, custom_queries = render_toolbar()
     edit_mode_enabled, editor, grid_box = render_query_window()
 
-    # Prevent F5 from refreshing the page using JavaScript
+    # Document-level listeners outlive this sub-page, so install them once per
+    # browser tab rather than on every visit. F5 is already blocked by the
+    # SPA shell (root.py); Ctrl+R is blocked here so it doesn't reload.
     ui.run_javascript("""
-        document.addEventListener('keydown', function(e) {
-            if (e.key === 'F5' || (e.ctrlKey && e.key === 'r')) {
-                e.preventDefault();
-            }
-        });
-    """)
+        if (!window.__wtQueryEditorKeys) {
+            window.__wtQueryEditorKeys = true;
 
-    ui.run_javascript("""
-        // Prevent text selection on grid when not in edit mode
-        const style = document.createElement('style');
-        style.id = 'ag-no-select';
-        style.textContent = '.ag-root-wrapper * { user-select: none; !important; }';
-        document.head.appendChild(style);
-        
-        document.addEventListener('keydown', function(e) {
-            if (e.ctrlKey && e.key === 'c') {
-                const selectedRows = Array.from(document.querySelectorAll('.ag-row-selected'));
-                if (!selectedRows.length) return;
-                
-                e.preventDefault();  // stop browser default copy
-                e.stopPropagation();
-                
-                selectedRows.sort((a, b) => {
-                    const aTop = parseInt(a.style.transform?.match(/translateY\\((\\d+)px\\)/)?.[1] || 0);
-                    const bTop = parseInt(b.style.transform?.match(/translateY\\((\\d+)px\\)/)?.[1] || 0);
-                    return aTop - bTop;
-                });
-                
-                const lines = selectedRows.map(row => {
-                    const cells = Array.from(row.querySelectorAll('.ag-cell[col-id]'));
-                    return cells.map(cell => cell.textContent.replace(/\\s+/g, ' ').trim()).join('\\t');
-                });
-                
-                navigator.clipboard.writeText(lines.join('\\n'));
-            }
-        }, true);  // true = capture phase, fires before browser default
+            document.addEventListener('keydown', function(e) {
+                if (e.ctrlKey && e.key === 'r') {
+                    e.preventDefault();
+                }
+            });
+
+            // Prevent text selection on grid when not in edit mode
+            const style = document.createElement('style');
+            style.id = 'ag-no-select';
+            style.textContent = '.ag-root-wrapper * { user-select: none; !important; }';
+            document.head.appendChild(style);
+
+            document.addEventListener('keydown', function(e) {
+                if (e.ctrlKey && e.key === 'c') {
+                    const selectedRows = Array.from(document.querySelectorAll('.ag-row-selected'));
+                    if (!selectedRows.length) return;
+
+                    e.preventDefault();  // stop browser default copy
+                    e.stopPropagation();
+
+                    selectedRows.sort((a, b) => {
+                        const aTop = parseInt(a.style.transform?.match(/translateY\\((\\d+)px\\)/)?.[1] || 0);
+                        const bTop = parseInt(b.style.transform?.match(/translateY\\((\\d+)px\\)/)?.[1] || 0);
+                        return aTop - bTop;
+                    });
+
+                    const lines = selectedRows.map(row => {
+                        const cells = Array.from(row.querySelectorAll('.ag-cell[col-id]'));
+                        return cells.map(cell => cell.textContent.replace(/\\s+/g, ' ').trim()).join('\\t');
+                    });
+
+                    navigator.clipboard.writeText(lines.join('\\n'));
+                }
+            }, true);  // true = capture phase, fires before browser default
+        }
     """)
 
     async def handle_key(e: KeyEventArguments):
@@ -11,10 +11,10 @@ DevOps sync buttons live in the toolbar.
 """
 
 from pathlib import Path
-import asyncio
 import re
 import yaml
 from nicegui import ui
+from ..config import YamlLoader
 from ..core.app import AppCore
 from ..ui.elements import toolbar, toolbar_group, page_card
 from ..helpers import UI_STYLES
@@ -96,7 +96,7 @@ def _config_path(core: AppCore, filename: str) -> Path:
 def _load_yaml(path: Path) -> dict:
     if path.exists():
         with path.open(encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=YamlLoader) or {}
     return {}
 
 
@@ -761,15 +761,19 @@ async def settings_page():
                     f"full: {_fmt_time(_eng.last_full_sync)}"
                 )
 
-            async def _run_incr():
+            # Update the timestamps when the background sync actually completes,
+            # instead of guessing with a fixed delay after starting it
+            if getattr(core, "_settings_sync_handler", None):
+                core.event_bus.unregister("devops_refreshed", core._settings_sync_handler)
+            core._settings_sync_handler = core.event_bus.register(
+                "devops_refreshed", _refresh_sync_labels
+            )
+
+            def _run_incr():
                 _svc.refresh_incremental_async()
-                await asyncio.sleep(0.5)
-                _refresh_sync_labels()
 
-            async def _run_full():
+            def _run_full():
                 _svc.refresh_full_async()
-                await asyncio.sleep(0.5)
-                _refresh_sync_labels()
 
             ui.button("Incremental", icon="sync", on_click=_run_incr).props(
                 "color=primary dense outline"
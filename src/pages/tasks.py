@@ -157,12 +157,11 @@ async def get_customer_project_data(core: AppCore) -> dict:
                WHERE p.is_current = 1"""
         )
 
-        project_names_by_cust = {}
-        if not grouped_df.empty:
-            for _, row in grouped_df.iterrows():
-                project_names_by_cust.setdefault(row["customer_name"], []).append(
-                    row["project_name"]
-                )
+        project_names_by_cust = (
+            grouped_df.groupby("customer_name", sort=False)["project_name"]
+            .agg(list)
+            .to_dict()
+        )
 
         return {
             "customer_data": customer_data,
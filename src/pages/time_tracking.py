@@ -13,6 +13,7 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Callable, Dict, Optional
 from dataclasses import dataclass, field
+from functools import partial
 
 from ..core import AppCore
 from ..helpers import UI_STYLES, extract_devops_id
@@ -33,6 +34,7 @@ from ..ui.keyboard_handlers import setup_debug_keyboard_handlers
 # ============================================================================
 
 TIME_OPTIONS = ["Day", "Week", "Month", "Year", "All-Time", "Custom"]
+UPDATE_DEBOUNCE_SECONDS = 0.15
 
 # ============================================================================
 # State Management
@@ -52,36 +54,70 @@ class PageState:
     show_bonus: bool = False
     edit_mode_enabled: bool = False
 
+    # Pending debounced refresh and a counter so only the newest one applies
+    update_timer = None
+    update_generation: int = 0
+    # Shape of the last full render; an unchanged shape only needs new values
+    layout_key = None
+
     # Sort orders
     customer_order: list = field(default_factory=list)
     project_orders: Dict[int, list] = field(default_factory=dict)
 
     # UI data (full dataframe cache)
     ui_data_df = None
+    # Plain-dict views of ui_data_df, rebuilt by set_ui_data()
+    project_values: Dict[tuple, dict] = field(default_factory=dict)
+    customer_totals: Dict[int, dict] = field(default_factory=dict)
+    # (customer_id, project_id) -> (customer_name, project_name, git_id)
+    project_info: Dict[tuple, tuple] = field(default_factory=dict)
+    # (customer_id, project_id) pairs with a running timer
+    active_rows: set = field(default_factory=set)
+
+    def set_ui_data(self, df) -> None:
+        """Cache the UI dataframe and precompute per-project and per-customer lookups."""
+        self.ui_data_df = df
+        value_cols = ["total_time", "user_bonus"]
+        self.customer_totals = (
+            df.groupby("customer_id", sort=False)[value_cols].sum().to_dict("index")
+        )
+        # One pass over plain column lists for all per-project lookups
+        self.project_values = {}
+        self.project_info = {}
+        self.active_rows = set()
+        for cid, pid, cname, pname, git_id, total_time, user_bonus, is_active in zip(
+            df["customer_id"].tolist(),
+            df["project_id"].tolist(),
+            df["customer_name"].tolist(),
+            df["project_name"].tolist(),
+            df["git_id"].tolist(),
+            df["total_time"].tolist(),
+            df["user_bonus"].tolist(),
+            df["is_active"].tolist(),
+        ):
+            key = (cid, pid)
+            self.project_values.setdefault(
+                key, {"total_time": total_time, "user_bonus": user_bonus}
+            )
+            self.project_info.setdefault(key, (cname, pname, git_id))
+            if is_active:
+                self.active_rows.add(key)
 
     def get_project_value(
         self, customer_id: int, project_id: int, column_name: str
     ) -> float:
-        """Get project value from dataframe."""
-        if self.ui_data_df is None:
-            return 0.0
-        row = self.ui_data_df[
-            (self.ui_data_df["customer_id"] == customer_id)
-            & (self.ui_data_df["project_id"] == project_id)
-        ]
-        if row.empty:
+        """Get project value from the cached lookup."""
+        row = self.project_values.get((customer_id, project_id))
+        if row is None:
             return 0.0
-        return float(row.iloc[0][column_name])
+        return float(row[column_name])
 
     def get_customer_total(self, customer_id: int, column_name: str) -> float:
-        """Get customer total from dataframe."""
-        if self.ui_data_df is None:
+        """Get customer total from the cached lookup."""
+        totals = self.customer_totals.get(customer_id)
+        if totals is None:
             return 0.0
-        return float(
-            self.ui_data_df[self.ui_data_df["customer_id"] == customer_id][
-                column_name
-            ].sum()
-        )
+        return float(totals[column_name])
 
 
 
@@ -174,6 +210,7 @@ async def time_tracking_page():
 
     async def on_timer_started(customer_id: int, project_id: int):
         """Handle timer start event - update UI data."""
+        state.active_rows.add((customer_id, project_id))
         core.event_bus.emit(
             "time_entry_started", customer_id=customer_id, project_id=project_id
         )
@@ -181,12 +218,13 @@ async def time_tracking_page():
 
     async def on_timer_stopped(customer_id: int, project_id: int):
         """Handle timer stop event - refresh data."""
+        state.active_rows.discard((customer_id, project_id))
         core.event_bus.emit(
             "time_entry_stopped", customer_id=customer_id, project_id=project_id
         )
-        # Update values incrementally without full rebuild
-        await update_time_tracker()
-        await update_tab_indicator_now()
+        # Update values incrementally without full rebuild; the two reads are
+        # independent, so overlap them
+        await asyncio.gather(update_time_tracker(), update_tab_indicator_now())
 
     # ========================================================================
     # Background Timers
@@ -252,8 +290,10 @@ async def time_tracking_page():
             """
         )
         active_names = [
-            f"{r['customer_name']} / {r['project_name']}"
-            for _, r in result.iterrows()
+            f"{customer} / {project}"
+            for customer, project in zip(
+                result["customer_name"], result["project_name"]
+            )
         ] if not result.empty else []
 
         core.event_bus.emit(
@@ -266,23 +306,32 @@ async def time_tracking_page():
     # UI Control Handlers
     # ========================================================================
 
+    def schedule_update():
+        """Debounce bursts of control changes into one trailing update."""
+        if state.update_timer:
+            state.update_timer.cancel()
+        state.update_timer = ui.timer(
+            UPDATE_DEBOUNCE_SECONDS, update_time_tracker, once=True
+        )
+
     def set_custom_radio(e):
         """Set time span to Custom when date picker changes."""
         selected_time.value = "Custom"
         state.selected_time = "Custom"
-        asyncio.create_task(update_time_tracker())
+        schedule_update()
 
     def on_radio_time_change(e):
         """Update date range when time span radio changes."""
         state.selected_time = selected_time.value
         date_input.value = helpers.get_range_for(state.selected_time)
-        asyncio.create_task(update_time_tracker())
+        schedule_update()
         core.logger.info(f"Time span changed to: {state.selected_time}")
 
     def on_radio_type_change(e):
         """Refresh UI when display type changes (Time/Bonus)."""
         state.show_bonus = show_bonus_toggle.value
-        asyncio.create_task(update_time_tracker())
+        # Both columns are already cached in state; no query needed
+        apply_ui_values()
 
     async def toggle_edit_mode():
         """Toggle between normal and edit mode for sorting."""
@@ -363,16 +412,13 @@ async def time_tracking_page():
     def _build_devops_selector(devops_engine, c_name, git_id, has_git_id):
         """Render DevOps ID dropdown + 'Store to DevOps' toggle. Returns (id_input, id_checkbox)."""
         id_checkbox = None
-        id_options = devops_engine.df[
-            (devops_engine.df["customer_name"] == c_name)
-            & (devops_engine.df["state"].isin(["Active", "New"]))
-        ][["display_name", "id"]].dropna()
+        id_options = devops_engine.get_selector_options(c_name)
         id_input = ui.select(
-            id_options["display_name"].tolist(),
+            id_options["display_name"].tolist() if id_options is not None else [],
             with_input=True,
             label="DevOps-ID",
         ).classes("w-full -mb-2")
-        if has_git_id:
+        if has_git_id and id_options is not None:
             match = id_options[id_options["id"] == git_id]
             id_input.value = match["display_name"].iloc[0] if not match.empty else None
         with ui.row().classes("w-full items-center justify-between -mt-2"):
@@ -391,83 +437,72 @@ async def time_tracking_page():
         on_close_callback: Optional[Callable] = None,
     ) -> None:
         """Show dialog for completing a time entry with comment and DevOps integration."""
-        # Query project/customer info
-        df = await core.query_engine.query_db(
-            """
-            select distinct t.customer_name, t.project_name, p.git_id
-            from time t
-            left join projects p on p.project_id = t.project_id
-            where t.customer_id = ? and t.project_id = ?
-            """,
-            params=(customer_id, project_id),
+        # Names and git_id come with the rendered rows, so no lookup query
+        c_name, p_name, git_id = state.project_info.get(
+            (customer_id, project_id), ("Unknown", "Unknown", 0)
         )
-
-        # Extract values with defaults
-        c_name = df.iloc[0]["customer_name"] if not df.empty else "Unknown"
-        p_name = df.iloc[0]["project_name"] if not df.empty else "Unknown"
-        git_id = df.iloc[0]["git_id"] if not df.empty else 0
         has_git_id = git_id is not None and git_id > 0
 
         # Check DevOps connection using engine method
         has_devops = core.devops_engine.has_customer_connection(c_name) if core.devops_engine else False
 
-        with ui.dialog().props("persistent") as popup:
-            with ui.card().classes(UI_STYLES.get_widget_width("extra_wide")):
-                # Title
-                ui.label(f"{p_name} - {c_name}").classes("text-h6 w-full")
-
-                # DevOps ID selector (if available)
-                id_input = None
-                id_checkbox = None
-                if has_devops:
-                    id_input, id_checkbox = _build_devops_selector(
-                        core.devops_engine, c_name, git_id, has_git_id
-                    )
+        _entry_card.clear()
+        with _entry_card:
+            # Title
+            ui.label(f"{p_name} - {c_name}").classes("text-h6 w-full")
 
-                # Comment input
-                comment_input = ui.textarea(
-                    label="Comment", placeholder="What work was done?"
-                ).classes("w-full -mt-2")
+            # DevOps ID selector (if available)
+            id_input = None
+            id_checkbox = None
+            if has_devops:
+                id_input, id_checkbox = _build_devops_selector(
+                    core.devops_engine, c_name, git_id, has_git_id
+                )
 
-                # Action buttons
-                async def handle_save():
-                    """Save time entry with parsed DevOps ID."""
-                    git_id_val = None
-                    store_to_devops = False
+            # Comment input
+            comment_input = ui.textarea(
+                label="Comment", placeholder="What work was done?"
+            ).classes("w-full -mt-2")
 
-                    if has_devops and id_input is not None:
-                        git_id_val = extract_devops_id(id_input.value)
-                        store_to_devops = id_checkbox.value if id_checkbox else False
+            # Action buttons
+            async def handle_save():
+                """Save time entry with parsed DevOps ID."""
+                git_id_val = None
+                store_to_devops = False
 
-                    core.logger.debug(
-                        f"Time entry save: git_id={git_id_val}, devops={store_to_devops}, "
-                        f"customer={customer_id}, project={project_id}",
-                    )
+                if has_devops and id_input is not None:
+                    git_id_val = extract_devops_id(id_input.value)
+                    store_to_devops = id_checkbox.value if id_checkbox else False
 
-                    if on_save_callback:
-                        await on_save_callback(
-                            git_id_val, comment_input.value, store_to_devops
-                        )
+                core.logger.debug(
+                    f"Time entry save: git_id={git_id_val}, devops={store_to_devops}, "
+                    f"customer={customer_id}, project={project_id}",
+                )
 
-                    popup.close()
+                if on_save_callback:
+                    await on_save_callback(
+                        git_id_val, comment_input.value, store_to_devops, c_name
+                    )
 
-                async def handle_delete():
-                    """Delete the time entry."""
-                    if on_delete_callback:
-                        await on_delete_callback()
-                    ui.notify("Entry deleted", color="negative")
-                    popup.close()
+                _entry_dialog.close()
 
-                def handle_close():
-                    """Close dialog without saving."""
-                    if on_close_callback:
-                        on_close_callback()
-                    popup.close()
+            async def handle_delete():
+                """Delete the time entry."""
+                if on_delete_callback:
+                    await on_delete_callback()
+                ui.notify("Entry deleted", color="negative")
+                _entry_dialog.close()
+
+            def handle_close():
+                """Close dialog without saving."""
+                if on_close_callback:
+                    on_close_callback()
+                _entry_dialog.close()
 
-                # Button row
-                _create_action_buttons(handle_save, handle_close, on_delete=handle_delete)
+            # Button row
+            _create_action_buttons(handle_save, handle_close, on_delete=handle_delete)
 
-        popup.open()
+        _entry_dialog.open()
 
     async def on_checkbox_change(event, checked, customer_id, project_id):
         """Handle checkbox change for time/project row."""
@@ -479,6 +514,15 @@ async def time_tracking_page():
         customer_id_int = int(customer_id)
         project_id_int = int(project_id)
 
+        # insert_time_row toggles, so never dispatch when the row is already
+        # in the requested state (e.g. started from another tab)
+        if ((customer_id_int, project_id_int) in state.active_rows) == checked:
+            core.logger.debug(
+                f"Timer for customer={customer_id_int}, project={project_id_int} "
+                f"already {'running' if checked else 'stopped'}, skipping"
+            )
+            return
+
         if checked:
             try:
                 await core.query_engine.function_db(
@@ -493,7 +537,7 @@ async def time_tracking_page():
         # Unchecked - show dialog for saving comment/DevOps
         checkbox = event.sender
 
-        async def handle_save(git_id_val, comment, store_to_devops):
+        async def handle_save(git_id_val, comment, store_to_devops, customer_name):
             """Save time entry with comment and optionally to DevOps."""
             try:
                 await core.query_engine.function_db(
@@ -514,17 +558,10 @@ async def time_tracking_page():
 
             # Save to DevOps if requested
             if store_to_devops and git_id_val and git_id_val > 0:
-                customer_name_df = await core.query_engine.query_db(
-                    "select customer_name from customers where customer_id = ?",
-                    params=(customer_id_int,),
-                )
-                if (
-                    core.devops_engine
-                    and core.devops_engine.manager
-                    and not customer_name_df.empty
-                ):
+                # Customer name is already resolved by the dialog - no DB lookup needed
+                if core.devops_engine and core.devops_engine.manager:
                     status, msg = core.devops_engine.manager.save_comment(
-                        customer_name=customer_name_df.iloc[0]["customer_name"],
+                        customer_name=customer_name,
                         comment=comment,
                         git_id=git_id_val,
                     )
@@ -552,10 +589,11 @@ async def time_tracking_page():
             on_close_callback=handle_close,
         )
 
+    async def _checkbox_cb(customer_id, project_id, e):
+        await on_checkbox_change(e, e.value, customer_id, project_id)
+
     def make_callback(customer_id, project_id):
-        async def _cb(e):
-            await on_checkbox_change(e, e.value, customer_id, project_id)
-        return _cb
+        return partial(_checkbox_cb, customer_id, project_id)
 
     async def show_manual_time_entry_dialog(customer_id: int, project_id: int):
         """Populate the pre-created dialog shell and open it."""
@@ -748,8 +786,22 @@ async def time_tracking_page():
         """
         core.logger.debug("Running render_time_tracker (full rebuild)")
 
+        # get_customer_ui_list also flags projects with a running timer (is_active)
         df = await get_ui_data()
-        state.ui_data_df = df
+        state.set_ui_data(df)
+
+        # Same customers/projects, order and mode as the last render: keep the
+        # element tree and only push the new values
+        if value_label_refs and get_layout_key(df) == state.layout_key:
+            apply_ui_values()
+            # Timers may have changed elsewhere; on_checkbox_change ignores
+            # these since active_rows already matches
+            for key, cb in checkbox_refs.items():
+                running = key in state.active_rows
+                if cb.value != running:
+                    cb.set_value(running)
+            core.logger.debug("Layout unchanged, skipped render_time_tracker rebuild")
+            return
 
         # Clear label references for new render
         value_label_refs.clear()
@@ -769,11 +821,7 @@ async def time_tracking_page():
             project, customer_id, project_index=None, total_projects=None
         ):
             """Create a single project row with checkbox/arrows and value."""
-            df_counts = await core.query_engine.query_db(
-                "select 1 from time where customer_id = ? and project_id = ? and end_time is null limit 1",
-                params=(customer_id, int(project["project_id"])),
-            )
-            initial_state_val = not df_counts.empty
+            initial_state_val = bool(project.is_active)
 
             with (
                 ui.row()
@@ -827,19 +875,19 @@ async def time_tracking_page():
                 else:
                     cb = ui.checkbox(
                         on_change=make_callback(
-                            project["customer_id"], project["project_id"]
+                            project.customer_id, project.project_id
                         ),
                         value=initial_state_val,
                     )
-                    checkbox_refs[(int(project["customer_id"]), int(project["project_id"]))] = cb
+                    checkbox_refs[(int(project.customer_id), int(project.project_id))] = cb
 
-                ui.label(str(project["project_name"])).classes(
+                ui.label(str(project.project_name)).classes(
                     UI_STYLES.get_widget_style("time_tracking_project_name")["classes"]
                 ).style(
                     "overflow: hidden; text-overflow: ellipsis; white-space: nowrap;"
                 )
 
-                value = project[column_name]
+                value = getattr(project, column_name)
                 total_string = format_value(value, is_time)
 
                 project_value_style = UI_STYLES.get_widget_style(
@@ -852,12 +900,12 @@ async def time_tracking_page():
                         project_value_style.get("style", "") + " white-space: nowrap;"
                     )
                 )
-                value_label_refs[(customer_id, project["project_id"])] = value_label
+                value_label_refs[(customer_id, project.project_id)] = value_label
 
                 with ui.context_menu():
-                    async def _open_manual(cid=int(project["customer_id"]), pid=int(project["project_id"])):
+                    async def _open_manual(cid=int(project.customer_id), pid=int(project.project_id)):
                         await show_manual_time_entry_dialog(cid, pid)
-                    async def _open_manual_start(cid=int(project["customer_id"]), pid=int(project["project_id"])):
+                    async def _open_manual_start(cid=int(project.customer_id), pid=int(project.project_id)):
                         await show_manual_start_dialog(cid, pid)
                     ui.menu_item("Add time entry", on_click=_open_manual).props("icon=add_circle")
                     ui.menu_item("Start from past time", on_click=_open_manual_start).props("icon=history")
@@ -953,28 +1001,30 @@ async def time_tracking_page():
                 with entity_card_content():
                     # Merge/init project order
                     customer_projects = group.sort_values("project_sort_order")
+                    project_rows = {
+                        row.project_id: row
+                        for row in customer_projects.itertuples(index=False)
+                    }
                     db_ordered = [
-                        (row["project_id"], row["project_name"])
-                        for _, row in customer_projects.iterrows()
+                        (pid, row.project_name) for pid, row in project_rows.items()
                     ]
 
                     if customer_id not in state.project_orders:
                         state.project_orders[customer_id] = db_ordered
                     else:
                         existing = state.project_orders[customer_id]
-                        existing_ids = [p[0] for p in existing]
+                        existing_ids = {p[0] for p in existing}
                         for pid, pname in db_ordered:
                             if pid not in existing_ids:
                                 existing.append((pid, pname))
-                        db_ids = [p[0] for p in db_ordered]
                         state.project_orders[customer_id] = [
-                            p for p in existing if p[0] in db_ids
+                            p for p in existing if p[0] in project_rows
                         ]
 
                     ordered_projects = state.project_orders[customer_id]
                     total_projects = len(ordered_projects)
                     for proj_idx, (proj_id, proj_name) in enumerate(ordered_projects):
-                        project_row = group[group["project_id"] == proj_id].iloc[0]
+                        project_row = project_rows[proj_id]
                         await make_project_row(
                             project_row,
                             customer_id,
@@ -1000,6 +1050,9 @@ async def time_tracking_page():
             state.customer_order.clear()
             state.customer_order.extend(customers_list)
 
+        # Split once by customer instead of masking the frame per card
+        groups_by_customer = dict(list(df.groupby("customer_id", sort=False)))
+
         # Rebuild container
         container.clear()
         with container:
@@ -1008,8 +1061,8 @@ async def time_tracking_page():
                 for cust_idx, (customer_id, customer_name) in enumerate(
                     state.customer_order
                 ):
-                    group = df[df["customer_id"] == customer_id]
-                    if not group.empty:
+                    group = groups_by_customer.get(customer_id)
+                    if group is not None:
                         await make_customer_card(
                             customer_id,
                             customer_name,
@@ -1018,31 +1071,56 @@ async def time_tracking_page():
                             total_customers=total_customers,
                         )
 
+        state.layout_key = get_layout_key(df)
         core.logger.debug("Completed render_time_tracker (full rebuild)")
 
-    async def update_time_tracker():
-        """
-        Update only the displayed values without rebuilding UI structure.
-
-        Much faster than full rebuild - just updates text in existing labels.
-        Used when toggling time/bonus or after timer stops.
-        """
-        df = await get_ui_data()
-        state.ui_data_df = df
+    def get_layout_key(df) -> tuple:
+        """Everything the card layout depends on besides the displayed values."""
+        return (
+            state.edit_mode_enabled,
+            tuple(state.customer_order),
+            tuple((cid, tuple(order)) for cid, order in state.project_orders.items()),
+            tuple(
+                df[
+                    ["customer_id", "customer_name", "project_id", "project_name"]
+                ].itertuples(index=False, name=None)
+            ),
+        )
 
-        # Determine display mode
+    def apply_ui_values():
+        """Push cached state values into the existing value and total labels."""
         is_time = not state.show_bonus
         column_name = get_column_name(is_time)
 
-        # Update project value labels
+        # Unchanged labels are skipped so they aren't re-serialized into the
+        # next outbox flush
         for (cust_id, proj_id), label in value_label_refs.items():
             value = state.get_project_value(cust_id, proj_id, column_name)
-            label.set_text(format_value(value, is_time))
+            text = format_value(value, is_time)
+            if label.text != text:
+                label.set_text(text)
 
-        # Update customer total labels
         for cust_id, label in customer_total_label_refs.items():
             total = state.get_customer_total(cust_id, column_name)
-            label.set_text(format_value(total, is_time))
+            text = format_value(total, is_time)
+            if label.text != text:
+                label.set_text(text)
+
+    async def update_time_tracker():
+        """
+        Update only the displayed values without rebuilding UI structure.
+
+        Much faster than full rebuild - just updates text in existing labels.
+        Used when toggling time/bonus or after timer stops.
+        """
+        state.update_generation += 1
+        generation = state.update_generation
+        df = await get_ui_data()
+        if generation != state.update_generation:
+            # A newer update started while this query ran; let it win
+            return
+        state.set_ui_data(df)
+        apply_ui_values()
 
         core.logger.debug("Values updated incrementally")
 
@@ -1061,8 +1139,11 @@ async def time_tracking_page():
 
     container = ui.scroll_area().classes("wt-page-content w-full")
 
-    # Pre-create dialog shell so it exists in the proper slot context at page load.
-    # show_manual_time_entry_dialog() clears + rebuilds the card body and then opens it.
+    # Pre-create dialog shells so they exist in the proper slot context at page load.
+    # The show_*_dialog() functions clear + rebuild the card body and then open them.
+    with ui.dialog().props("persistent") as _entry_dialog:
+        _entry_card = ui.card().classes(UI_STYLES.get_widget_width("extra_wide"))
+
     with ui.dialog().props("persistent") as _manual_dialog:
         _manual_card = ui.card().classes(UI_STYLES.get_widget_width("extra_wide"))
 
@@ -6,12 +6,78 @@ All services handle ui.notify() via the event bus automatically.
 """
 
 import asyncio
+import queue
+from concurrent.futures import Future
 from typing import Optional, Any, Dict, List
 from datetime import datetime
 import threading
+from nicegui import app
 from ..core.app import AppCore
 
 
+# Shared worker pool for background service calls. Each worker keeps one event
+# loop for its lifetime, so coroutines don't pay for a new thread + loop per call.
+# Workers are daemon threads: a blocking Azure call must never hold up process
+# exit, which a ThreadPoolExecutor would (its workers are joined at exit).
+_SERVICE_WORKERS = 4
+_work_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_workers: List[threading.Thread] = []
+_workers_lock = threading.Lock()
+
+
+def _service_worker() -> None:
+    """Run queued calls on this thread's own event loop until told to stop."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        while True:
+            item = _work_queue.get()
+            if item is None:
+                return
+            future, call = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(call(loop))
+            except BaseException as e:
+                future.set_exception(e)
+    finally:
+        loop.close()
+
+
+def _submit(call) -> Future:
+    """Queue call(loop) for a service worker, starting the workers on first use."""
+    with _workers_lock:
+        if not _workers:
+            for i in range(_SERVICE_WORKERS):
+                worker = threading.Thread(
+                    target=_service_worker, name=f"wt-service_{i}", daemon=True
+                )
+                worker.start()
+                _workers.append(worker)
+    future = Future()
+    _work_queue.put((future, call))
+    return future
+
+
+def shutdown_service_workers() -> None:
+    """Cancel queued work and let idle workers close their loops and exit."""
+    while True:
+        try:
+            item = _work_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is not None:
+            item[0].cancel()
+    with _workers_lock:
+        for _ in _workers:
+            _work_queue.put(None)
+        _workers.clear()
+
+
+app.on_shutdown(shutdown_service_workers)
+
+
 class BaseService:
     """
     Base class for all services.
@@ -24,9 +90,9 @@ class BaseService:
         self.logger = core.logger
         self.event_bus = core.event_bus
 
-    def run_in_thread(self, func, *args, **kwargs):
+    def run_in_thread(self, func, *args, **kwargs) -> Future:
         """
-        Execute a function in a background thread.
+        Execute a function on the shared background worker pool.
 
         The function can be sync or async. Results are not returned;
         use the event bus to communicate results back to the UI.
@@ -37,26 +103,19 @@ class BaseService:
             **kwargs: Keyword arguments
 
         Returns:
-            threading.Thread: The thread object
+            concurrent.futures.Future: Handle for the submitted work
         """
 
-        def runner():
+        def runner(loop):
             try:
                 if asyncio.iscoroutinefunction(func):
-                    # Create new event loop for this thread
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    result = loop.run_until_complete(func(*args, **kwargs))
-                    loop.close()
-                else:
-                    result = func(*args, **kwargs)
+                    return loop.run_until_complete(func(*args, **kwargs))
+                return func(*args, **kwargs)
             except Exception as e:
                 self.logger.error(f"Error in background task: {e}")
                 self.event_bus.notify(f"Background task failed: {e}", type_="negative")
 
-        thread = threading.Thread(target=runner, daemon=True)
-        thread.start()
-        return thread
+        return _submit(runner)
 
 
 class DatabaseService(BaseService):
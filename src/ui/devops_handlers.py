@@ -395,16 +395,15 @@ class DevOpsWorkItemHandlers:
                 current_text = editor_widget.value or ""
                 pattern = rf"^(\*\*{re.escape(field_name)}:\*\*)(.*)$"
 
-                match = re.search(pattern, current_text, re.MULTILINE)
-                if match:
-                    replacement = rf"\1 {new_value}"
-                    updated_text = re.sub(
-                        pattern,
-                        replacement,
-                        current_text,
-                        count=1,
-                        flags=re.MULTILINE,
-                    )
+                # Single pass: substitute and report whether the field line exists
+                updated_text, count = re.subn(
+                    pattern,
+                    lambda m: f"{m.group(1)} {new_value}",
+                    current_text,
+                    count=1,
+                    flags=re.MULTILINE,
+                )
+                if count:
                     editor_widget.value = updated_text
                     editor_widget.update()
                     # Note: preview will be updated automatically by on_value_change handler